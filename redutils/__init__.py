@@ -19,6 +19,7 @@ from .utils import (
     create_embeds as create_embeds,
     modify_embeds as modify_embeds,
     group_items_by as group_items_by,
+    parse_all_mentions as parse_all_mentions,
     parse_raw_mentions as parse_raw_mentions,
     parse_raw_channel_mentions as parse_raw_channel_mentions,
     parse_raw_role_mentions as parse_raw_role_mentions,
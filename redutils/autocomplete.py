@@ -1,8 +1,11 @@
+import heapq
 import inspect
-from fuzzywuzzy import process
-from typing import Any, Callable, Iterable, List, Tuple, Optional
+import collections
+from typing import Any, Callable, FrozenSet, Iterable, List, OrderedDict, Tuple, Optional
 
+import numpy as np
 import discord
+from rapidfuzz import process, fuzz, utils
 from redbot.core.bot import Red
 from redbot.core import commands
 
@@ -15,14 +18,14 @@ __all__ = (
 
 
 class PromptSelect(discord.ui.Select):
-    def __init__(self, parent: "PromptView", matches: List[Tuple[int, str]]) -> None:
+    def __init__(self, parent: "PromptView", matches: List[Tuple[Any, float, int]]) -> None:
         super().__init__(
             placeholder="Select an option below...",
             options=[
                 discord.SelectOption(
-                    label=str(match), description=f"{probability}% chance."
+                    label=str(match[0]), description=f"{round(match[1])}% chance."
                 )
-                for match, probability in matches
+                for match in matches
             ],
         )
         self.parent: PromptView = parent
@@ -30,14 +33,13 @@ class PromptSelect(discord.ui.Select):
     async def callback(self, interaction: discord.Interaction[Red], /) -> None:
         assert interaction.message is not None
 
-        await interaction.response.defer(thinking=True)
+        await interaction.response.defer()
 
         selected = self.values
         if not selected:
             return
 
         self.parent.item = selected[0]
-        await interaction.delete_original_response()
         await interaction.message.delete()
 
         self.parent.stop()
@@ -48,13 +50,13 @@ class PromptView(discord.ui.View):
         self,
         *,
         ctx: commands.Context,
-        matches: List[Tuple[int, str]],
+        matches: List[Tuple[Any, float, int]],
         param: inspect.Parameter,
         value: str,
     ) -> None:
         super().__init__()
         self.ctx: commands.Context = ctx
-        self.matches: List[Tuple[int, str]] = matches
+        self.matches: List[Tuple[Any, float, int]] = matches
         self.param: inspect.Parameter = param
         self.value: str = value
         self.item: Optional[str] = None
@@ -80,14 +82,62 @@ class AutoComplete:
     def __init__(self, func: Callable[..., Any], param_name: str) -> None:
         self.callback: Callable[..., Any] = func
         self.param_name: str = param_name
-        
+        self._processed_cache: OrderedDict[
+            Tuple[str, ...], Tuple[List[Tuple[Any, str]], FrozenSet[str]]
+        ] = collections.OrderedDict()
+
+    def _get_processed(
+        self, constricted: Iterable[Any], /
+    ) -> Tuple[List[Tuple[Any, str]], FrozenSet[str]]:
+        candidates = list(constricted)
+        key = tuple(str(c) for c in candidates)
+        entry = self._processed_cache.get(key)
+        if entry is None:
+            processed = [(c, utils.default_process(s)) for c, s in zip(candidates, key)]
+            entry = self._processed_cache[key] = (processed, frozenset(key))
+            if len(self._processed_cache) > 8:
+                self._processed_cache.popitem(last=False)
+        else:
+            self._processed_cache.move_to_end(key)
+        return entry
+
+    def _score_pool(
+        self, processed: List[Tuple[Any, str]], query: str, /
+    ) -> List[Tuple[int, float]]:
+        scores = process.cdist(
+            [query],
+            [p for _, p in processed],
+            scorer=fuzz.WRatio,
+            processor=None,
+            score_cutoff=40,
+        )[0]
+        hits = np.flatnonzero(scores >= 40)
+        return heapq.nlargest(
+            25, zip(hits.tolist(), scores[hits].tolist()), key=lambda kv: kv[1]
+        )
+
     async def prompt_correct_input(
         self, ctx: commands.Context, param: inspect.Parameter, /, *, value: str, constricted: Iterable[Any]
     ) -> str:
         assert ctx.command is not None
         
-        result = [(item, 0) for item in constricted]
-            
+        processed, candidate_set = self._get_processed(constricted)
+        if value in candidate_set:
+            return value
+
+        query = utils.default_process(value or "")
+        if query:
+            result = [
+                (processed[index][0], score, index)
+                for index, score in self._score_pool(processed, query)
+            ]
+        else:
+            result = [(item, 0.0, index) for index, (item, _) in enumerate(processed[:25])]
+        if not result:
+            raise commands.CommandError(
+                "None of the options were close to that, you need to redo this command."
+            )
+
         view = PromptView(ctx=ctx, matches=result, param=param, value=value) # type: ignore
         await ctx.send(embed=view.embed, view=view)
         await view.wait()
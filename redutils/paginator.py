@@ -1,6 +1,6 @@
-from itertools import islice
+import math
 from contextlib import suppress
-from typing import NamedTuple, Optional, List, Iterable, Tuple, Any, Union
+from typing import NamedTuple, Optional, List, Callable, Dict, Union
 
 import discord
 from redbot.core import commands
@@ -14,28 +14,31 @@ __all__ = (
 )
 
 
-def get_chunks(iterable: Iterable[Any], size: int) -> Iterable[Tuple[Any, Any]]:
-    it = iter(iterable)
-    return iter(lambda: tuple(islice(it, size)), ())
-
-
 class Page(NamedTuple):
     index: int
     content: str
 
 
 class Pages:
+    __slots__ = ("page_fn", "cur_page", "_total", "_cache")
+
     def __init__(
         self,
-        pages: List,
+        page_fn: Callable[[int], str],
+        total: int,
     ) -> None:
         super().__init__()
-        self.pages = pages
+        self.page_fn = page_fn
         self.cur_page = 1
+        self._total = total
+        self._cache: Dict[int, str] = {}
 
     @property
     def current_page(self) -> Page:
-        return Page(self.cur_page, self.pages[self.cur_page - 1])
+        content = self._cache.get(self.cur_page)
+        if content is None:
+            content = self._cache[self.cur_page] = self.page_fn(self.cur_page)
+        return Page(self.cur_page, content)
 
     @property
     def next_page(self) -> Optional[Page]:
@@ -65,10 +68,21 @@ class Pages:
 
     @property
     def total(self) -> int:
-        return len(self.pages)
+        return self._total
 
 
 class RedPaginator:
+    __slots__ = (
+        "ctx",
+        "per_page",
+        "timeout",
+        "title",
+        "show_page_count",
+        "lines",
+        "pages",
+        "_embeds",
+    )
+
     def __init__(
         self,
         ctx: commands.Context,
@@ -87,17 +101,22 @@ class RedPaginator:
 
         self.lines: List = []
         self.pages: Optional[Pages] = None
+        self._embeds: Dict[int, discord.Embed] = {}
 
     def add_lines(self, line: str, sep: str = "\n") -> None:
         self.lines.append(f"{line}{sep}")
 
-    @property
-    def embed(
-        self, color: Union[int, discord.Color] = discord.Color.dark_embed()
+    def _get_page(self, index: int, /) -> str:
+        return "".join(self.lines[(index - 1) * self.per_page : index * self.per_page])
+
+    def _make_embed(
+        self, page: Page, /, color: Union[int, discord.Color] = discord.Color.dark_embed()
     ) -> discord.Embed:
-        page: Page = self.pages.current_page  # type: ignore
+        em = self._embeds.get(page.index)
+        if em is not None:
+            return em
 
-        em: discord.Embed = discord.Embed(color=color)
+        em = discord.Embed(color=color)
         if self.title:
             em.title = self.title
 
@@ -106,14 +125,16 @@ class RedPaginator:
         if self.show_page_count:
             em.set_footer(text=f"Page {page.index} of {self.pages.total}")  # type: ignore
 
+        self._embeds[page.index] = em
         return em
 
-    async def start(self):
-        _pages = []
-        for page in get_chunks(self.lines, self.per_page):
-            _pages.append("".join(page))
+    @property
+    def embed(self) -> discord.Embed:
+        return self._make_embed(self.pages.current_page)  # type: ignore
 
-        self.pages = Pages(_pages)
+    async def start(self):
+        self.pages = Pages(self._get_page, math.ceil(len(self.lines) / self.per_page))
+        self._embeds.clear()
 
         if not self.pages.total > 1:
             return await self.ctx.send(embed=self.embed)
@@ -121,9 +142,8 @@ class RedPaginator:
         view = PaginatorView(
             self.ctx,
             pages=self.pages,
-            embed=self.embed,
+            embed_fn=self._make_embed,
             timeout=self.timeout,
-            show_page_count=self.show_page_count,
         )
 
         view.message = await self.ctx.send(embed=self.embed, view=view)
@@ -136,16 +156,14 @@ class PaginatorView(discord.ui.View):
         self,
         ctx: commands.Context,
         pages: Pages,
-        embed: discord.Embed,
+        embed_fn: Callable[[Page], discord.Embed],
         timeout: float,
-        show_page_count: bool,
     ) -> None:
         super().__init__(timeout=timeout)
 
         self.ctx = ctx
         self.pages = pages
-        self.embed = embed
-        self.show_page_count = show_page_count
+        self.embed_fn = embed_fn
 
         if self.pages.cur_page == 1:
             self.children[0].disabled = True  # type: ignore
@@ -170,12 +188,6 @@ class PaginatorView(discord.ui.View):
             for child in self.children:
                 child.disabled = False  # type: ignore
 
-    def _update_embed(self, page: Page, /) -> None:
-        if self.show_page_count:
-            self.embed.set_footer(text=f"Page {page.index} of {self.pages.total}")
-
-        self.embed.description = page.content
-
     async def interaction_check(self, interaction: discord.Interaction, /) -> bool:
         if interaction.user.id != self.ctx.author.id:
             await interaction.response.send_message(
@@ -203,9 +215,8 @@ class PaginatorView(discord.ui.View):
         await interaction.response.defer()
         page = self.pages.first_page
 
-        self._update_embed(page)
         self._lock()
-        await interaction.message.edit(embed=self.embed, view=self)  # type: ignore
+        await interaction.message.edit(embed=self.embed_fn(page), view=self)  # type: ignore
 
     @discord.ui.button(
         style=discord.ButtonStyle.green,
@@ -218,9 +229,8 @@ class PaginatorView(discord.ui.View):
         await interaction.response.defer()
         page = self.pages.previous_page
 
-        self._update_embed(page)  # type: ignore
         self._lock()
-        await interaction.message.edit(embed=self.embed, view=self)  # type: ignore
+        await interaction.message.edit(embed=self.embed_fn(page), view=self)  # type: ignore
 
     @discord.ui.button(
         style=discord.ButtonStyle.green,
@@ -233,9 +243,8 @@ class PaginatorView(discord.ui.View):
         await interaction.response.defer()
         page = self.pages.next_page
 
-        self._update_embed(page)  # type: ignore
         self._lock()
-        await interaction.message.edit(embed=self.embed, view=self)  # type: ignore
+        await interaction.message.edit(embed=self.embed_fn(page), view=self)  # type: ignore
 
     @discord.ui.button(
         style=discord.ButtonStyle.green,
@@ -248,6 +257,5 @@ class PaginatorView(discord.ui.View):
         await interaction.response.defer()
         page = self.pages.last_page
 
-        self._update_embed(page)
         self._lock()
-        await interaction.message.edit(embed=self.embed, view=self)  # type: ignore
+        await interaction.message.edit(embed=self.embed_fn(page), view=self)  # type: ignore
@@ -1,7 +1,11 @@
 import io
 import re
+import types
+import inspect
 import logging
-from typing import List, Dict, Optional, Union, Any
+import operator
+from collections import defaultdict
+from typing import List, Dict, Optional, Union, Any, Tuple, Callable
 
 import discord
 
@@ -12,6 +16,7 @@ __all__ = (
     "create_embeds",
     "modify_embeds",
     "group_items_by",
+    "parse_all_mentions",
     "parse_raw_mentions",
     "parse_raw_role_mentions",
     "parse_raw_channel_mentions",
@@ -19,6 +24,26 @@ __all__ = (
 )
 
 
+_ALL_MENTIONS_RE = re.compile(r"<(?:@!?(\d{15,20})|@&(\d{15,20})|#(\d{15,20}))>")
+
+_MethodPair = Tuple[str, Callable[..., Any], str, Callable[..., Any]]
+_METHOD_CACHE: Dict[Tuple[type, str], Optional[_MethodPair]] = {}
+
+
+def _resolve_methods(cls: type, attr: str) -> Optional[_MethodPair]:
+    get_name = f"get_{attr}"
+    getter = inspect.getattr_static(cls, get_name, None)
+    if not isinstance(getter, types.FunctionType):
+        return None
+    for fetch_name in (f"fetch_{attr}", f"_fetch_{attr}"):
+        fetcher = inspect.getattr_static(cls, fetch_name, None)
+        if fetcher is not None:
+            break
+    if not isinstance(fetcher, types.FunctionType):
+        return None
+    return get_name, getter, fetch_name, fetcher
+
+
 def silence_debug_loggers(
     main_logger: logging.Logger, logger_level: int, *, logger_names: List[str]
 ) -> None:
@@ -85,10 +110,7 @@ def write_to_discord_file(filename: str, content: str) -> discord.File:
     :class:`discord.File`
         The file to be send.
     """
-    stream = io.BytesIO()
-    stream.write(content.encode())
-    stream.seek(0)
-    return discord.File(stream, filename=filename)
+    return discord.File(io.BytesIO(content.encode("utf-8")), filename=filename)
 
 
 def create_embeds(
@@ -127,36 +149,40 @@ def create_embeds(
 
     embeds: List[discord.Embed] = []
     max_desc_length: int = 4096
-    append_list: bool = False
-    embed: discord.Embed = discord.Embed(
-        title="",
-        description="",
-        color=color,
-    )
-
-    for i, arg in enumerate(arguments):
-        if len(embed.description) + len(fmt_line.format(**arg)) + 1 > max_desc_length:  # type: ignore
-            embeds.append(embed)
-            embed: discord.Embed = discord.Embed(
-                title="",
-                description="",
-                color=color,
-            )
-
-        elif per_page is not None and 1 > 0 and i % per_page == 0:
-            embeds.append(embed)
-            embed: discord.Embed = discord.Embed(
-                title="",
-                description="",
-                color=color,
+    buf: List[str] = []
+    buf_len: int = 0
+    count_on_page: int = 0
+
+    for arg in arguments:
+        line = fmt_line.format_map(arg)
+        ln = len(line) + 1
+        if count_on_page and (
+            buf_len + ln > max_desc_length
+            or (per_page is not None and count_on_page >= per_page)
+        ):
+            embeds.append(
+                discord.Embed(
+                    title="",
+                    description="".join(buf),
+                    color=color,
+                )
             )
-
-        embed.description += fmt_line.format(**arg) + "\n"  # type: ignore
-        if i == len(arguments) - 1:
-            append_list = True
-
-    if append_list:
-        embeds.append(embed)
+            buf = []
+            buf_len = 0
+            count_on_page = 0
+
+        buf.append(line)
+        buf.append("\n")
+        buf_len += ln
+        count_on_page += 1
+
+    embeds.append(
+        discord.Embed(
+            title="",
+            description="".join(buf),
+            color=color,
+        )
+    )
 
     return embeds
 
@@ -209,27 +235,37 @@ def modify_embeds(
     :class:`List[discord.Embed]`
         The modified embeds.
     """
+    total = len(embeds)
+    thumb_is_list = isinstance(thumbnail_image_url, list)
+    img_is_list = isinstance(image_url, list)
+    t_title = t_color = t_url = None
+    if title_kwargs:
+        t_title = title_kwargs.get("title")
+        t_color = title_kwargs.get("color")
+        t_url = title_kwargs.get("url")
+
     for i, em in enumerate(embeds):
         if title_kwargs:
-            em.title = title_kwargs.get("title")
-            em.color = title_kwargs.get("color")
-            em.url = title_kwargs.get("url")
+            em.title = t_title
+            em.color = t_color
+            em.url = t_url
         if author_kwargs:
             em.set_author(**author_kwargs)
         if footer_kwargs:
             em.set_footer(**footer_kwargs)
         if show_page_number:
-            if em.footer.text:
-                em.set_footer(text=f"{em.footer.text} | Page {i + 1}/{len(embeds)}")
+            footer_text = em.footer.text
+            if footer_text:
+                em.set_footer(text=f"{footer_text} | Page {i + 1}/{total}")
             else:
-                em.set_footer(text=f"Page {i + 1}/{len(embeds)}")
+                em.set_footer(text=f"Page {i + 1}/{total}")
         if thumbnail_image_url:
-            if isinstance(thumbnail_image_url, list):
+            if thumb_is_list:
                 em.set_thumbnail(url=thumbnail_image_url[i])
             else:
                 em.set_thumbnail(url=thumbnail_image_url)
         if image_url:
-            if isinstance(image_url, list):
+            if img_is_list:
                 em.set_image(url=image_url[i])
             else:
                 em.set_image(url=image_url)
@@ -270,18 +306,10 @@ def group_items_by(items: List[Any], key_path: List[str]) -> List[List[Any]]:
     if not key_path:
         return [items]
 
-    def get_attr(obj, path):
-        for attr in path:
-            obj = getattr(obj, attr)
-        return obj
-
-    key = key_path[0]
-    groups = {}
+    getter = operator.attrgetter(key_path[0])
+    groups: Dict[Any, List[Any]] = defaultdict(list)
     for item in items:
-        value = get_attr(item, key.split("."))
-        if value not in groups:
-            groups[value] = []
-            groups[value].append(item)
+        groups[getter(item)].append(item)
 
     sub_key_path = key_path[1:]
     sub_groups = []
@@ -291,6 +319,39 @@ def group_items_by(items: List[Any], key_path: List[str]) -> List[List[Any]]:
     return sub_groups
 
 
+def parse_all_mentions(text: str) -> Tuple[List[int], List[int], List[int]]:
+    """
+    A helper function that parses user, role and channel mentions from a
+    string in a single pass.
+
+    .. versionadded:: 1.0
+
+    Parameters
+    ----------
+    text: str
+        The text to parse mentions from.
+
+    Returns
+    ----------
+    :class:`Tuple[List[int], List[int], List[int]]`
+        The user, role and channel IDs that were mentioned, in that order.
+    """
+    users: List[int] = []
+    roles: List[int] = []
+    channels: List[int] = []
+    if "<" not in text:
+        return users, roles, channels
+    for match in _ALL_MENTIONS_RE.finditer(text):
+        user, role, channel = match.groups()
+        if user is not None:
+            users.append(int(user))
+        elif role is not None:
+            roles.append(int(role))
+        else:
+            channels.append(int(channel))
+    return users, roles, channels
+
+
 def parse_raw_mentions(text: str) -> List[int]:
     """
     A helper function that parses mentions from a sing as an array of
@@ -315,7 +376,7 @@ def parse_raw_mentions(text: str) -> List[int]:
     :class:`List[int]`
         A list of user IDs that were mentioned.
     """
-    return [int(x) for x in re.findall(r"<@!?(\d{15,20})>", text)]
+    return parse_all_mentions(text)[0]
 
 
 def parse_raw_role_mentions(text: str) -> List[int]:
@@ -334,7 +395,7 @@ def parse_raw_role_mentions(text: str) -> List[int]:
     :class:`List[int]`
         A list of role IDs that were mentioned.
     """
-    return [int(x) for x in re.findall(r"<@&(\d{15,20})>", text)]
+    return parse_all_mentions(text)[1]
 
 
 def parse_raw_channel_mentions(text: str) -> List[int]:
@@ -355,7 +416,7 @@ def parse_raw_channel_mentions(text: str) -> List[int]:
     :class:`List[int]`
         A list of channel IDs that were mentioned.
     """
-    return [int(x) for x in re.findall(r"<#(\d{15,20})>", text)]
+    return parse_all_mentions(text)[2]
 
 
 async def get_or_fetch(
@@ -404,18 +465,36 @@ async def get_or_fetch(
 
         channel = await get_or_fetch(guild, 'channel', channel_id, default=None)
     """
-    getter = getattr(obj, f"get_{attr}")(id)
-    if getter is None:
+    cls = type(obj)
+    try:
+        methods = _METHOD_CACHE[(cls, attr)]
+    except KeyError:
+        methods = _METHOD_CACHE[(cls, attr)] = _resolve_methods(cls, attr)
+
+    # Only plain functions defined on the class are cached. Anything else, or a
+    # method shadowed on the instance, goes through a normal attribute lookup.
+    instance_dict = getattr(obj, "__dict__", None)
+    if methods is not None and not (
+        instance_dict and (methods[0] in instance_dict or methods[2] in instance_dict)
+    ):
+        getter = methods[1].__get__(obj, cls)
+        fetcher = methods[3].__get__(obj, cls)
+    else:
+        getter = getattr(obj, f"get_{attr}")
+        fetcher = getattr(obj, f"fetch_{attr}", None) or getattr(obj, f"_fetch_{attr}", None)
+
+    result = getter(id)
+    if result is None:
+        if fetcher is None:
+            raise AttributeError(f"{cls.__name__!r} object has no attribute 'fetch_{attr}'")
         try:
-            getter = await getattr(obj, f"fetch_{attr}")(id)
-        except AttributeError:
-            getter = await getattr(obj, f"_fetch_{attr}")(id)
-            if getter is None:
+            result = await fetcher(id)
+            if result is None:
                 raise ValueError(f"Could not find {attr} with id {id} on {obj}")
         except (discord.HTTPException, ValueError):
             if default is not discord.utils.MISSING:
                 return default
             else:
                 raise
-    return getter
+    return result
             
@@ -1,22 +1,20 @@
 import os
-import re
 import setuptools
 
 with open("README.md", mode="r") as file:
     long_description = file.read()
-    
+
+version_ns = {}
 with open(
     os.path.join(os.path.join(os.path.dirname(__file__), "redutils"), "version.py"), mode="r"
 ) as file:
-    content = file.read()
-    
-__version__ = float(
-    re.compile(r"__version__\s*=\s*(?P<version>\d+\.\d+)").search(content).groupdict()["version"] # type: ignore
-)
+    exec(file.read(), version_ns)
+
+__version__ = version_ns["__version__"]
 
 setuptools.setup(
     name="redutils",
-    version=str(__version__),
+    version=__version__,
     author="japandotorg [inthedark.org]",
     author_email="japandotorg@pm.me",
     description="Utils for Red-Discord Bot",
@@ -31,6 +29,7 @@ setuptools.setup(
     ],
     python_requires=">=3.8.1",
     install_requires=[
-        "fuzzywuzzy"
+        "rapidfuzz",
+        "numpy",
     ],
 )